@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+
+from quart import escape
 
 from geminiportal.handlers.gopher import GopherItem
 from geminiportal.urls import URLReference
 
 
-@dataclass
+@dataclass(frozen=True)
 class Position:
     """
     Container for an A-Frame position component.
@@ -17,6 +20,10 @@ class Position:
     z: float = 0
 
     def __str__(self):
+        return self._str
+
+    @cached_property
+    def _str(self) -> str:
         return f"{self.x:.4f} {self.y:.4f} {self.z:.4f}"
 
     def __add__(self, other: Position) -> Position:
@@ -27,7 +34,7 @@ class Position:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class Rotation:
     """
     Container for an A-Frame rotation component.
@@ -38,6 +45,10 @@ class Rotation:
     z_deg: float = 0  # Roll
 
     def __str__(self):
+        return self._str
+
+    @cached_property
+    def _str(self) -> str:
         return f"{self.x_deg:.4f} {self.y_deg:.4f} {self.z_deg:.4f}"
 
     def __add__(self, other: Rotation) -> Rotation:
@@ -48,7 +59,7 @@ class Rotation:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class Scale:
     """
     Container for an A-Frame scale component.
@@ -59,6 +70,10 @@ class Scale:
     z: float = 0
 
     def __str__(self):
+        return self._str
+
+    @cached_property
+    def _str(self) -> str:
         return f"{self.x:.4f} {self.y:.4f} {self.z:.4f}"
 
     def __add__(self, other: Scale) -> Scale:
@@ -73,7 +88,7 @@ class Scale:
         return cls(value, value, value)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Color:
     """
     Container for an A-Frame HTML color.
@@ -84,6 +99,10 @@ class Color:
     b: int
 
     def __str__(self):
+        return self._str
+
+    @cached_property
+    def _str(self) -> str:
         return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
 
     def adjust(self, value: int = -10) -> Color:
@@ -93,6 +112,12 @@ class Color:
         return Color(r, g, b)
 
 
+# Component values that are shared between entities. The containers are
+# immutable, so their string representation is only formatted once.
+OBJ_SCALE = Scale.const(0.003)
+TEXT_COLOR = Color(255, 255, 255)
+
+
 @dataclass
 class AFrameEntity:
     """
@@ -104,9 +129,9 @@ class AFrameEntity:
     children: list[AFrameEntity] = field(default_factory=list)
 
     def __str__(self):
-        attr_str = " ".join((f'{k}="{v}"' for k, v in self.attributes.items()))
+        attr_str = "".join(f' {k}="{escape(v)}"' for k, v in self.attributes.items())
         children_str = "".join(str(c) for c in self.children)
-        return f"<{self.tag} {attr_str}>{children_str}</{self.tag}>"
+        return f"<{self.tag}{attr_str}>{children_str}</{self.tag}>"
 
     @classmethod
     def build_obj(
@@ -126,7 +151,7 @@ class AFrameEntity:
             "rotation": rotation + Rotation(x_deg=180),
             "obj-model": f"obj: {obj}",
             "material": f"color: {color}",
-            "scale": Scale.const(0.003),
+            "scale": OBJ_SCALE,
         }
         if url:
             proxy_url = url.get_proxy_url(vr=1)
@@ -157,7 +182,7 @@ class AFrameEntity:
                 "rotation": rotation + Rotation(x_deg=180),
                 "width": width,
                 "value": text,
-                "color": Color(255, 255, 255),
+                "color": TEXT_COLOR,
                 "align": "center",
                 "wrap-count": 12,
             },
@@ -169,30 +194,31 @@ class GopherIcon:
     Builds the A-Frame representation for a given gopher menu item.
     """
 
+    color: Color
+    obj: str
+
+    # Offset of the item's label relative to the model, these are constant
+    # for each icon type so they're only constructed once.
+    text_position: Position
+    text_rotation = Rotation()
+
     def __init__(self, item: GopherItem, position: Position, rotation: Rotation):
         self.item = item
         self.position = position
         self.rotation = rotation
 
-    def build(self) -> AFrameEntity:
-        raise NotImplementedError()
-
-
-class GopherDir(GopherIcon):
-    color = Color(0, 104, 168)
-
     def build(self) -> AFrameEntity:
         obj = AFrameEntity.build_obj(
             position=self.position,
             rotation=self.rotation,
             color=self.color,
-            obj="#dir-obj",
+            obj=self.obj,
             url=self.item.url,
         )
         obj.children.append(
             AFrameEntity.build_text(
-                position=Position(0, -201, -85),
-                rotation=Rotation(),
+                position=self.text_position,
+                rotation=self.text_rotation,
                 text=self.item.item_text,
                 width=500,
             )
@@ -200,26 +226,20 @@ class GopherDir(GopherIcon):
         return obj
 
 
+class GopherDir(GopherIcon):
+    color = Color(0, 104, 168)
+    obj = "#dir-obj"
+    text_position = Position(0, -201, -85)
+
+
 class GopherDocument(GopherIcon):
     color = Color(223, 116, 0)
+    obj = "#document-obj"
+    text_position = Position(0, -213, -57)
 
     def build(self) -> AFrameEntity:
-        obj = AFrameEntity.build_obj(
-            position=self.position,
-            rotation=self.rotation,
-            color=self.color,
-            obj="#document-obj",
-            url=self.item.url,
-        )
+        obj = super().build()
         obj.attributes["navigate-on-click"] = f"url: {self.item.url.get_proxy_url(vr=1)}"
-        obj.children.append(
-            AFrameEntity.build_text(
-                position=Position(0, -213, -57),
-                rotation=Rotation(),
-                text=self.item.item_text,
-                width=500,
-            )
-        )
         return obj
 
 
@@ -229,68 +249,28 @@ class GopherURL(GopherDocument):
 
 class GopherSearch(GopherIcon):
     color = Color(135, 25, 105)
-
-    def build(self) -> AFrameEntity:
-        obj = AFrameEntity.build_obj(
-            position=self.position,
-            rotation=self.rotation,
-            color=self.color,
-            obj="#search-obj",
-            url=self.item.url,
-        )
-        obj.children.append(
-            AFrameEntity.build_text(
-                position=Position(0, -273, -80),
-                rotation=Rotation(),
-                text=self.item.item_text,
-                width=500,
-            )
-        )
-        return obj
+    obj = "#search-obj"
+    text_position = Position(0, -273, -80)
 
 
 class GopherSound(GopherIcon):
     color = Color(223, 116, 0)
-
-    def build(self) -> AFrameEntity:
-        obj = AFrameEntity.build_obj(
-            position=self.position,
-            rotation=self.rotation,
-            color=self.color,
-            obj="#sound-obj",
-            url=self.item.url,
-        )
-        obj.children.append(
-            AFrameEntity.build_text(
-                position=Position(0, -192, -157),
-                rotation=Rotation(),
-                text=self.item.item_text,
-                width=500,
-            )
-        )
-        return obj
+    obj = "#sound-obj"
+    text_position = Position(0, -192, -157)
 
 
 class GopherTelnet(GopherIcon):
     color = Color(255, 178, 0)
+    obj = "#telnet-obj"
+    text_position = Position(0, -236, -87)
 
-    def build(self) -> AFrameEntity:
-        obj = AFrameEntity.build_obj(
-            position=self.position,
-            rotation=self.rotation,
-            color=self.color,
-            obj="#telnet-obj",
-            url=self.item.url,
-        )
-        obj.children.append(
-            AFrameEntity.build_text(
-                position=Position(0, -236, -87),
-                rotation=Rotation(),
-                text=self.item.item_text,
-                width=500,
-            )
-        )
-        return obj
+
+ICON_CLASSES: dict[str, type[GopherIcon]] = {
+    "1": GopherDir,
+    "7": GopherSearch,
+    "8": GopherTelnet,
+    "s": GopherSound,
+}
 
 
 def build_3d_icon(
@@ -301,20 +281,9 @@ def build_3d_icon(
     """
     Construct a 3D icon for the gopher item at the given position.
     """
-    icon_class: type[GopherIcon]
-
-    if item.item_type == "1":
-        icon_class = GopherDir
-    elif item.is_url:
-        icon_class = GopherURL
-    elif item.item_type == "7":
-        icon_class = GopherSearch
-    elif item.item_type == "8":
-        icon_class = GopherTelnet
-    elif item.item_type == "s":
-        icon_class = GopherSound
-    else:
-        icon_class = GopherDocument
+    icon_class = ICON_CLASSES.get(item.item_type)
+    if icon_class is None:
+        icon_class = GopherURL if item.is_url else GopherDocument
 
     return icon_class(item, position, rotation).build()
 
@@ -355,3 +324,12 @@ def build_kiosk(text: str) -> AFrameEntity:
         ]
     )
     return obj
+
+
+@lru_cache(maxsize=16)
+def render_kiosk(text: str) -> str:
+    """
+    Render the kiosk HTML, which is identical for every scene that uses the
+    same text.
+    """
+    return str(build_kiosk(text))
@@ -1,5 +1,3 @@
-from base64 import b64encode
-
 from geminiportal.handlers.base import TemplateHandler
 
 
@@ -12,6 +10,5 @@ class AudioHandler(TemplateHandler):
 
     def get_context(self):
         context = super().get_context()
-        data = b64encode(self.content).decode("ascii")
-        context["data_url"] = f"data:{self.mimetype};base64,{data}"
+        context["data_url"] = self.get_data_url(self.mimetype)
         return context
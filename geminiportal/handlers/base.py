@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from base64 import b64encode
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, ClassVar
 
@@ -123,6 +124,7 @@ class TemplateHandler(BaseHandler):
         self.mimetype = mimetype
         self.charset = charset
         self._text: str | None = None
+        self._proxy_urls: dict[str, str] = {}
 
     @property
     def text(self) -> str:
@@ -137,6 +139,26 @@ class TemplateHandler(BaseHandler):
 
         return self._text
 
+    def get_proxy_url(self, url: URLReference) -> str:
+        """
+        Build the proxy link for a URL referenced in the response.
+
+        Pages often link to the same URL many times, so the result is cached
+        for the lifetime of the handler.
+        """
+        key = url.get_url()
+        proxy_url = self._proxy_urls.get(key)
+        if proxy_url is None:
+            proxy_url = self._proxy_urls[key] = url.get_proxy_url()
+        return proxy_url
+
+    def get_data_url(self, mimetype: str) -> str:
+        """
+        Encode the content as a data: URL that can be embedded in the page.
+        """
+        data = b64encode(self.content).decode("ascii")
+        return f"data:{mimetype};base64,{data}"
+
     async def render(self) -> Response:
         context = self.get_context()
         content = await render_template(self.template, **context)
@@ -1,5 +1,3 @@
-from base64 import b64encode
-
 from geminiportal.handlers.base import TemplateHandler
 
 
@@ -8,9 +6,8 @@ class BaseFileHandler(TemplateHandler):
         context = super().get_context()
 
         mimetype = self.mimetype or "application/octet-stream"
-        data = b64encode(self.content).decode("ascii")
         context["mimetype"] = mimetype
-        context["data_url"] = f"data:{mimetype};base64,{data}"
+        context["data_url"] = self.get_data_url(mimetype)
         context["filename"] = self.url.get_filename()
         return context
 
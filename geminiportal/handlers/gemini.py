@@ -20,6 +20,7 @@ RABBIT_ART = r"""
   __\  _  /__
  '----' '----'
 """
+RABBIT_ART_LINES = RABBIT_ART.splitlines(keepends=False)
 
 
 class GeminiHandler(TemplateHandler):
@@ -27,8 +28,6 @@ class GeminiHandler(TemplateHandler):
     The full-featured gemtext -> html converter.
     """
 
-    _rabbit_re = re.compile(RABBIT_INLINE)
-
     template = "proxy/handlers/gemini.html"
 
     line_buffer: list[str]
@@ -70,7 +69,7 @@ class GeminiHandler(TemplateHandler):
 
         for line in self.text.splitlines():
             line = line.rstrip()
-            line = self._rabbit_re.sub("🐇", line)
+            line = line.replace(RABBIT_INLINE, "🐇")
             if line.startswith("```"):
                 if self.active_type == "pre":
                     yield from self.flush()
@@ -86,15 +85,15 @@ class GeminiHandler(TemplateHandler):
                 yield from self.flush()
                 yield {
                     "item_type": "pre",
-                    "lines": RABBIT_ART.splitlines(keepends=False),
+                    "lines": RABBIT_ART_LINES,
                 }
 
             elif line.startswith("=>"):
                 yield from self.flush()
-                url, link_text, prefix = parse_link_line(line[2:], self.url)
+                url, link_text, prefix = parse_link_line(line.removeprefix("=>"), self.url)
                 yield {
                     "item_type": "link",
-                    "url": url.get_proxy_url(),
+                    "url": self.get_proxy_url(url),
                     "text": link_text,
                     "prefix": prefix,
                     "external_indicator": url.get_external_indicator(),
@@ -102,10 +101,10 @@ class GeminiHandler(TemplateHandler):
 
             elif line.startswith("=:"):
                 yield from self.flush()
-                url, link_text, prefix = parse_link_line(line[2:], self.url)
+                url, link_text, prefix = parse_link_line(line.removeprefix("=:"), self.url)
                 yield {
                     "item_type": "prompt",
-                    "url": url.get_proxy_url(),
+                    "url": self.get_proxy_url(url),
                     "text": link_text,
                     "prefix": prefix,
                     "external_indicator": url.get_external_indicator(),
@@ -113,25 +112,25 @@ class GeminiHandler(TemplateHandler):
 
             elif line.startswith("###"):
                 yield from self.flush()
-                text = line[3:].lstrip()
+                text = line.removeprefix("###").lstrip()
                 anchor = self.get_anchor(text)
                 yield {"item_type": "h3", "text": text, "anchor": anchor}
 
             elif line.startswith("##"):
                 yield from self.flush()
-                text = line[2:].lstrip()
+                text = line.removeprefix("##").lstrip()
                 anchor = self.get_anchor(text)
                 yield {"item_type": "h2", "text": text, "anchor": anchor}
 
             elif line.startswith("#"):
                 yield from self.flush()
-                text = line[1:].lstrip()
+                text = line.removeprefix("#").lstrip()
                 anchor = self.get_anchor(text)
                 yield {"item_type": "h1", "text": text, "anchor": anchor}
 
             elif line.startswith("* "):
                 yield from self.flush("ul")
-                self.line_buffer.append(line[1:].lstrip())
+                self.line_buffer.append(line.removeprefix("*").lstrip())
 
             elif line.startswith("> ") or line == ">":
                 yield from self.flush("blockquote")
@@ -5,7 +5,7 @@ from collections.abc import Iterable
 from typing import Any
 
 from geminiportal.handlers.base import TemplateHandler
-from geminiportal.urls import URLReference, quote_gopher
+from geminiportal.urls import URLReference, encode_idna, quote_gopher
 
 
 class GopherIcon:
@@ -115,22 +115,35 @@ class GopherItem:
 
     @classmethod
     def from_item_description(cls, line: str, base: URLReference) -> GopherItem:
-        parts = line.split("\t")
+        # Locate the field separators directly instead of splitting the whole
+        # line, everything after the fourth tab is the gopher+ string.
+        tab1 = line.find("\t")
+        tab2 = line.find("\t", tab1 + 1)
+        tab3 = line.find("\t", tab2 + 1)
+        if tab1 < 1 or tab2 < 0 or tab3 < 0:
+            return GopherItem(base, "i", line, "", "", 0)
+
+        tab4 = line.find("\t", tab3 + 1)
+        if tab4 < 0:
+            port, gopher_plus_string = line[tab3 + 1 :], ""
+        else:
+            port, gopher_plus_string = line[tab3 + 1 : tab4], line[tab4 + 1 :]
+
         try:
             return GopherItem(
                 base,
-                parts[0][0],
-                parts[0][1:],
-                parts[1],
-                parts[2],
-                int(parts[3]) if parts[3] else 0,
-                "\t".join(parts[4:]),
+                line[0],
+                line[1:tab1],
+                line[tab1 + 1 : tab2],
+                line[tab2 + 1 : tab3],
+                int(port) if port else 0,
+                gopher_plus_string,
             )
         except Exception:
             return GopherItem(base, "i", line, "", "", 0)
 
     def get_netloc(self, default_port: int):
-        encoded_host = self.host.encode("idna").decode("ascii")
+        encoded_host = encode_idna(self.host)
         if self.port == default_port:
             return encoded_host
         else:
@@ -39,15 +39,12 @@ class GopherPlusHandler(TemplateHandler):
 
         for line in self.text.splitlines():
             if line.startswith("+"):
-                parts = line[1:].split(":", maxsplit=1)
-                attribute = parts[0]
-                if len(parts) == 1:
+                attribute, sep, item_description = line[1:].partition(":")
+                if not sep:
                     attribute_data = {}
                 else:
-                    item_description = parts[1]
-                    if item_description.startswith(" "):
-                        # Strip out the space after the colon, "+INFO: <item-description>".
-                        item_description = item_description[1:]
+                    # Strip out the space after the colon, "+INFO: <item-description>".
+                    item_description = item_description.removeprefix(" ")
 
                     item = GopherItem.from_item_description(item_description, self.url)
                     attribute_data = {"item": item}
@@ -96,7 +93,7 @@ class GopherPlusHandler(TemplateHandler):
         for line in self.line_buffer:
             line = line.strip()
             if item_url:
-                content_type = line.split(":", maxsplit=1)[0]
+                content_type = line.partition(":")[0]
                 url = item_url.copy()
                 url.gopher_plus_string = f"+{quote_gopher(content_type)}"
             else:
@@ -111,11 +108,7 @@ class GopherPlusHandler(TemplateHandler):
         for line in self.line_buffer:
             line = line.strip()
 
-            parts = line.split(":", maxsplit=1)
-            if len(parts) == 1:
-                name, val = parts[0], ""
-            else:
-                name, val = parts
+            name, _, val = line.partition(":")
 
             comments, meta_tag = self.split_attribute_meta_tag(val.strip())
             line_data = {"comments": comments, "meta_tag": meta_tag, "name": name}
@@ -134,11 +127,8 @@ class GopherPlusHandler(TemplateHandler):
         E.g.
             Mod-Date: Sat Nov 26 15:56:40 2022 <20221126155640>
         """
-        parts = text.rsplit("<", maxsplit=1)
-        if len(parts) == 1:
-            return text, None
-
-        if parts[1][-1] != ">":
+        comments, sep, meta_tag = text.rpartition("<")
+        if not sep or not meta_tag.endswith(">"):
             return text, None
 
-        return parts[0].rstrip(), parts[1][:-1]
+        return comments.rstrip(), meta_tag[:-1]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import math
 from collections.abc import Iterable
 from typing import Any
@@ -9,7 +10,7 @@ from geminiportal.aframe import (
     Position,
     Rotation,
     build_3d_icon,
-    build_kiosk,
+    render_kiosk,
 )
 from geminiportal.handlers.base import TemplateHandler
 from geminiportal.handlers.gopher import GopherItem
@@ -35,22 +36,31 @@ class SpiralLayout:
         self.radius_increment = radius_increment
         self.height_increment = height_increment
 
-    def render(self, items: list[GopherItem]) -> Iterable[AFrameEntity]:
+        # The spiral passes through the same angles on every revolution, so
+        # the trig and the rotation that makes each box face the center only
+        # need to be calculated once for each step.
         angle_increment = 2 * math.pi / self.initial_density
+        self.angle_table: list[tuple[float, float, Rotation]] = []
+        for i in range(self.initial_density):
+            angle = i * angle_increment
+            self.angle_table.append(
+                (
+                    math.cos(angle - math.pi / 2),
+                    math.sin(angle - math.pi / 2),
+                    Rotation(0, -math.degrees(angle), 0),
+                )
+            )
 
+    def render(self, items: list[GopherItem]) -> Iterable[AFrameEntity]:
         # Generate A-Frame entities for each item.
         radius = self.initial_radius
         height = self.initial_height
-        for i, item in enumerate(items):
+        angles = itertools.cycle(self.angle_table)
+        for item, (cos_angle, sin_angle, rotation) in zip(items, angles):
             # Calculate the x, y position for each box in the spiral.
-            x = radius * math.cos(i * angle_increment - math.pi / 2)
-            z = radius * math.sin(i * angle_increment - math.pi / 2)
-
-            # Calculate rotation so that the box faces the center.
-            y_deg = -math.degrees(i * angle_increment)
-
+            x = radius * cos_angle
+            z = radius * sin_angle
             position = Position(x, height, z)
-            rotation = Rotation(0, y_deg, 0)
 
             yield build_3d_icon(item, position, rotation)
 
@@ -64,23 +74,26 @@ class GopherVRHandler(TemplateHandler):
 
     def get_context(self) -> dict[str, Any]:
         context = super().get_context()
-        context["scene"] = self.layout_scene()
+        context["scene"] = self.render_scene()
         return context
 
-    def layout_scene(self) -> Iterable[AFrameEntity]:
-        yield build_kiosk("Main Gopher Menu")
+    def render_scene(self) -> str:
+        """
+        Pre-render the entire scene so the template can insert it as a
+        single block of HTML.
+        """
+        scene = [render_kiosk("Main Gopher Menu")]
         layout = SpiralLayout()
-        yield from layout.render(self.get_items())
+        scene.extend(str(entity) for entity in layout.render(self.get_items()))
+        return "\n".join(scene)
 
     def get_items(self) -> list[GopherItem]:
-        items = []
-        for line in self.text.splitlines():
-            line = line.rstrip()
-            if line == ".":
-                break  # Gopher directory EOF
-
-            item = GopherItem.from_item_description(line, self.url)
-            if item.url:
-                items.append(item)
-
-        return items
+        lines = self.text.splitlines()
+        try:
+            # Gopher directory EOF, drop the terminator and anything after it
+            del lines[lines.index(".") :]
+        except ValueError:
+            pass
+
+        items = (GopherItem.from_item_description(line, self.url) for line in lines)
+        return [item for item in items if item.url]
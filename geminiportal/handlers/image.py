@@ -1,7 +1,9 @@
-from base64 import b64encode
-
 from geminiportal.handlers.base import TemplateHandler
 
+# Images larger than this are loaded from the raw proxy URL instead of being
+# inlined, to avoid base64 encoding (and holding) megabytes of data per page.
+INLINE_IMAGE_MAX_SIZE = 2**17
+
 
 class ImageHandler(TemplateHandler):
     """
@@ -12,7 +14,9 @@ class ImageHandler(TemplateHandler):
 
     def get_context(self):
         context = super().get_context()
-        data = b64encode(self.content).decode("ascii")
-        context["data_url"] = f"data:{self.mimetype};base64,{data}"
         context["raw_url"] = self.url.get_proxy_url(raw=True)
+        if len(self.content) > INLINE_IMAGE_MAX_SIZE:
+            context["data_url"] = context["raw_url"]
+        else:
+            context["data_url"] = self.get_data_url(self.mimetype)
         return context
@@ -23,7 +23,7 @@ class NexHandler(TemplateHandler):
                 url, link_text, prefix = parse_link_line(line[2:], self.url)
                 yield {
                     "item_type": "a",
-                    "url": url.get_proxy_url(),
+                    "url": self.get_proxy_url(url),
                     "external_indicator": url.get_external_indicator(),
                     "text": link_text,
                     "prefix": prefix,
@@ -36,13 +36,23 @@ class TextHandler(TemplateHandler):
         return context
 
     def get_body(self) -> str:
-        buffer = []
-        for line in self.text.splitlines(keepends=False):
-            line = escape(line)
-            line = url_re.sub(self.insert_anchor, line)
-            buffer.append(line)
+        # Walk the URLs in the raw text and escape the segments in between,
+        # so links are detected before their characters are turned into
+        # HTML entities.
+        text = "\n".join(self.text.splitlines(keepends=False))
+        if "://" not in text:
+            # No URLs, skip running the regex altogether
+            return escape(text)
 
-        body = "\n".join(buffer)
+        buffer: list[str] = []
+        pos = 0
+        for match in url_re.finditer(text):
+            buffer.append(escape(text[pos : match.start()]))
+            buffer.append(self.insert_anchor(match))
+            pos = match.end()
+        buffer.append(escape(text[pos:]))
+
+        body = "".join(buffer)
         return body
 
     def insert_anchor(self, match: re.Match) -> str:
@@ -50,6 +60,6 @@ class TextHandler(TemplateHandler):
         try:
             url = URLReference(m)
         except ValueError:
-            return m  # Invalid URL, skip adding the anchor tag
+            return escape(m)  # Invalid URL, skip adding the anchor tag
         else:
-            return f'<a href="{url.get_proxy_url()}">{url}</a>'
+            return f'<a href="{escape(self.get_proxy_url(url))}">{escape(url)}</a>'
@@ -8,28 +8,23 @@ from geminiportal.protocols.text import TxtRequest
 from geminiportal.urls import URLReference
 from geminiportal.utils import ProxyOptions
 
+REQUEST_CLASSES: dict[str, type[BaseRequest]] = {
+    "spartan": SpartanRequest,
+    "text": TxtRequest,
+    "finger": FingerRequest,
+    "gemini": GeminiRequest,
+    "nex": NexRequest,
+    "gopher": GopherRequest,
+    "gophers": GopherRequest,
+}
 
-def build_proxy_request(url: URLReference, options: ProxyOptions | None = None) -> BaseRequest:
-    request_class: type[BaseRequest]
 
+def build_proxy_request(url: URLReference, options: ProxyOptions | None = None) -> BaseRequest:
     if options is None:
         options = ProxyOptions()
 
-    if url.scheme == "spartan":
-        request_class = SpartanRequest
-    elif url.scheme == "text":
-        request_class = TxtRequest
-    elif url.scheme == "finger":
-        request_class = FingerRequest
-    elif url.scheme == "gemini":
-        request_class = GeminiRequest
-    elif url.scheme == "nex":
-        request_class = NexRequest
-    elif url.scheme == "gopher":
-        request_class = GopherRequest
-    elif url.scheme == "gophers":
-        request_class = GopherRequest
-    else:
+    request_class = REQUEST_CLASSES.get(url.scheme)
+    if request_class is None:
         raise ValueError(f"Unsupported URL scheme: {url.scheme}")
 
     return request_class(url, options)
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import re
 import socket
-from asyncio.exceptions import IncompleteReadError
+import ssl
 from collections.abc import AsyncIterator
+from functools import cached_property
 
 from quart import Response as QuartResponse
 from werkzeug.wrappers.response import Response as WerkzeugResponse
@@ -17,8 +17,9 @@ from geminiportal.utils import ProxyOptions
 
 _logger = logging.getLogger(__name__)
 
-# Chunk size for streaming files, taken from the twisted FileSender class
-CHUNK_SIZE = 2**14
+# Chunk size for streaming files, this matches the default buffer limit of
+# asyncio's StreamReader
+CHUNK_SIZE = 2**16
 
 # When not streaming, limit the maximum response size to avoid running out
 # of RAM when downloading & converting large files to HTML.
@@ -32,24 +33,39 @@ BLOCKED_HOSTS = [
 ]
 
 # Ports that the proxied servers can be hosted on
-ALLOWED_PORTS = {
-    70,
-    77,
-    79,
-    300,
-    301,
-    3000,
-    3333,
-    1900,
-    *range(1960, 2021),
-    *range(7000, 7100),
-    8070,
-}
+ALLOWED_PORTS = frozenset(
+    {
+        70,
+        77,
+        79,
+        300,
+        301,
+        3000,
+        3333,
+        1900,
+        *range(1960, 2021),
+        *range(7000, 7100),
+        8070,
+    }
+)
 
 # Time waiting to establish a connection before aborting
 CONNECT_TIMEOUT = 10
 
 
+def create_ssl_context() -> ssl.SSLContext:
+    """
+    Build a TLS context that accepts any server certificate.
+
+    Loading the default CA certificates is slow, so each protocol creates a
+    single context at import time and shares it between all of its requests.
+    """
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
 class ProxyError(Exception):
     pass
 
@@ -65,7 +81,8 @@ class BaseRequest:
     Encapsulates a request to a protocol.
     """
 
-    _blocked_hosts = [re.compile(rf"(?:.+\.)?{host}\.?$", flags=re.I) for host in BLOCKED_HOSTS]
+    # Normalized the same way as the host that's checked against them
+    _blocked_hosts = frozenset(host.lower().rstrip(".") for host in BLOCKED_HOSTS)
 
     def __init__(self, url: URLReference, options: ProxyOptions):
         self.url = url
@@ -75,17 +92,21 @@ class BaseRequest:
         self.clean()
 
     def clean(self):
-        for pattern in self._blocked_hosts:
-            if pattern.match(self.host):
+        # Check the host and each of its parent domains against the blocklist
+        host = self.host.rstrip(".").lower()
+        while host:
+            if host in self._blocked_hosts:
                 raise ValueError(
                     "This host has kindly requested that their content "
                     "not be accessed via web proxy."
                 )
+            _, _, host = host.partition(".")
+
         if self.port not in ALLOWED_PORTS:
             raise ValueError(f"Proxied content is disabled over port {self.port}.")
 
     async def get_response(self):
-        _logger.info(f"{self.__class__.__name__}: Making request to {self.url}")
+        _logger.info("%s: Making request to %s", self.__class__.__name__, self.url)
         try:
             response = await self.fetch()
         except socket.gaierror:
@@ -93,19 +114,19 @@ class BaseRequest:
         except OSError as e:
             raise ProxyError(f"Connection error: {e}")
 
-        _logger.info(f"{self.__class__.__name__}: Response received: {response.status}")
+        _logger.info("%s: Response received: %s", self.__class__.__name__, response.status)
         return response
 
     @staticmethod
     def parse_response_header(raw_header: bytes) -> tuple[str, str]:
-        header = raw_header.decode()
-        parts = header.strip().split(maxsplit=1)
+        # Split the raw bytes first so only the fields themselves are decoded
+        parts = raw_header.strip().split(maxsplit=1)
         if len(parts) == 1:
-            status, meta = parts[0], ""
+            status, meta = parts[0], b""
         else:
             status, meta = parts
 
-        return status, meta
+        return status.decode(), meta.decode()
 
     async def open_connection(self, **kwargs) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
         future = asyncio.open_connection(self.host, self.port, **kwargs)
@@ -156,7 +177,7 @@ class BaseResponse:
     def title_display(self) -> str:
         return self.url.hostname or "<unknown>"
 
-    @property
+    @cached_property
     def status_display(self) -> str:
         """
         A human-readable status message for the response, if available.
@@ -176,18 +197,15 @@ class BaseResponse:
 
         Used for gemini/spartan style responses.
         """
-        parts = meta.split(";", maxsplit=1)
-        if len(parts) == 2:
-            mimetype, extra = parts
-        else:
-            mimetype, extra = parts[0], ""
+        mimetype, _, extra = meta.partition(";")
         mimetype = mimetype.strip()
 
         params = {}
-        for param in extra.split(";"):
-            parts = param.strip().split("=", maxsplit=1)
-            if len(parts) == 2:
-                params[parts[0].lower()] = parts[1]
+        if "=" in extra:
+            for param in extra.split(";"):
+                key, sep, value = param.strip().partition("=")
+                if sep:
+                    params[key.lower()] = value
 
         return mimetype, params
 
@@ -202,27 +220,39 @@ class BaseResponse:
             # This will fail if the remote server has already closed the
             # socket via SSL close_notify, but there is no way to know
             # that ahead of time.
-            _logger.warning(f"Error closing socket: {e}")
+            _logger.warning("Error closing socket: %s", e)
+
+    def abort(self) -> None:
+        """
+        Drop the socket connection without a graceful shutdown.
+
+        Used on error paths, where there's no point in flushing buffers or
+        waiting for the TLS close_notify exchange.
+        """
+        _logger.info("Aborting socket")
+        self.writer.transport.abort()
 
     async def get_body(self) -> bytes:
         """
         Return the entire response body as bytes, up to the max body size.
         """
+        buffer = bytearray()
         try:
-            data = await self.reader.readexactly(MAX_BODY_SIZE)
-        except IncompleteReadError as e:
-            # If EOF was received before the MAX_BODY_SIZE, success!
-            # Even though this says "partial", it's the entire body.
-            self.close()
-            return e.partial
+            while len(buffer) < MAX_BODY_SIZE:
+                chunk = await self.reader.read(min(CHUNK_SIZE, MAX_BODY_SIZE - len(buffer)))
+                if not chunk:
+                    # EOF was received before the MAX_BODY_SIZE, success!
+                    self.close()
+                    return bytes(buffer)
+                buffer += chunk
         except Exception:
-            self.close()
+            self.abort()
             raise
-        else:
-            # We have reached the MAX_BODY_SIZE before the EOF was
-            # received. Don't close the connection just yet, because
-            # we may want to continue streaming the connection.
-            raise ProxyResponseSizeError(data)
+
+        # We have reached the MAX_BODY_SIZE before the EOF was
+        # received. Don't close the connection just yet, because
+        # we may want to continue streaming the connection.
+        raise ProxyResponseSizeError(bytes(buffer))
 
     async def stream_body(self) -> AsyncIterator[bytes]:
         """
@@ -231,7 +261,11 @@ class BaseResponse:
         try:
             while chunk := await self.reader.read(CHUNK_SIZE):
                 yield chunk
-        finally:
+        except BaseException:
+            # Includes the HTTP client disconnecting mid-stream
+            self.abort()
+            raise
+        else:
             self.close()
 
     async def build_proxy_response(self) -> QuartResponse | WerkzeugResponse:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import ssl
+from weakref import WeakKeyDictionary
 
 from quart import Response as QuartResponse
 from quart import render_template
@@ -11,6 +12,7 @@ from geminiportal.protocols.base import (
     BaseProxyResponseBuilder,
     BaseRequest,
     BaseResponse,
+    create_ssl_context,
 )
 from geminiportal.utils import describe_tls_cert
 
@@ -19,44 +21,50 @@ _logger = logging.getLogger(__name__)
 
 class CloseNotifyState:
     """
-    Inject into the SSL context to register if the TLS close_notify signal
-    was received at the end of the connection.
+    Registers if the TLS close_notify signal was received at the end of the
+    connection.
     """
 
-    def __init__(self, context: ssl.SSLContext):
+    def __init__(self):
         self.received: bool = False
 
-        def msg_callback(connection, direction, v, c, m, data):
-            if m == ssl._TLSAlertType.CLOSE_NOTIFY:  # type: ignore  # noqa
-                if direction == "read":
-                    _logger.info("CLOSE_NOTIFY received")
-                    self.received = True
-
-        # This is a private debugging hook provided by the SSL library
-        context._msg_callback = msg_callback  # type: ignore
-
     def __bool__(self) -> bool:
         return self.received
 
 
+# Connections on the shared SSL context, mapped to their close_notify state
+_close_notify_states: WeakKeyDictionary[ssl.SSLObject, CloseNotifyState] = WeakKeyDictionary()
+
+# The message callback fires for every TLS message, so resolve this once
+_CLOSE_NOTIFY = ssl._TLSAlertType.CLOSE_NOTIFY  # type: ignore  # noqa
+
+
+def _msg_callback(connection, direction, v, c, m, data):
+    if m == _CLOSE_NOTIFY:
+        if direction == "read":
+            state = _close_notify_states.get(connection)
+            if state is not None:
+                _logger.info("CLOSE_NOTIFY received")
+                state.received = True
+
+
 class GeminiRequest(BaseRequest):
     """
     Encapsulates a gemini:// request.
     """
 
-    def create_ssl_context(self) -> ssl.SSLContext:
-        context = ssl.create_default_context()
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-        return context
+    ssl_context = create_ssl_context()
 
-    async def fetch(self) -> GeminiResponse:
-        context = self.create_ssl_context()
-        tls_close_notify = CloseNotifyState(context)
+    # This is a private debugging hook provided by the SSL library
+    ssl_context._msg_callback = _msg_callback  # type: ignore
 
-        reader, writer = await self.open_connection(ssl=context)
+    async def fetch(self) -> GeminiResponse:
+        reader, writer = await self.open_connection(ssl=self.ssl_context)
         ssock = writer.get_extra_info("ssl_object")
 
+        tls_close_notify = CloseNotifyState()
+        _close_notify_states[ssock] = tls_close_notify
+
         tls_cert = ssock.getpeercert(True)
         tls_version = ssock.version()
         tls_cipher, _, _ = ssock.cipher()
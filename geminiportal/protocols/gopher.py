@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import ssl
-
 from quart import Response as QuartResponse
 from quart import render_template
 
@@ -10,6 +8,7 @@ from geminiportal.protocols.base import (
     BaseProxyResponseBuilder,
     BaseRequest,
     BaseResponse,
+    create_ssl_context,
 )
 from geminiportal.utils import smart_decode
 
@@ -19,9 +18,11 @@ class GopherRequest(BaseRequest):
     Encapsulates a gopher:// request.
     """
 
+    ssl_context = create_ssl_context()
+
     async def fetch(self) -> GopherResponse | GopherPlusResponse:
         if self.url.scheme == "gophers":
-            context = self.make_ssl_context()
+            context = self.ssl_context
         else:
             context = None
 
@@ -46,8 +47,8 @@ class GopherRequest(BaseRequest):
         else:
             raise ValueError("Invalid response, this server does not support Gopher+.")
 
-        header = raw_header.decode()
-        data_length = int(header[1:])
+        # int() accepts the ASCII digits directly, along with the line ending
+        data_length = int(raw_header[1:])
         meta = meta.strip()
 
         return GopherPlusResponse(
@@ -59,12 +60,6 @@ class GopherRequest(BaseRequest):
             data_length=data_length,
         )
 
-    def make_ssl_context(self) -> ssl.SSLContext:
-        context = ssl.create_default_context()
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-        return context
-
 
 class GopherResponse(BaseResponse):
     def __init__(self, request, reader, writer):
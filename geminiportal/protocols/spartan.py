@@ -11,6 +11,7 @@ from geminiportal.protocols.base import (
     BaseRequest,
     BaseResponse,
 )
+from geminiportal.urls import encode_idna
 
 
 class SpartanRequest(BaseRequest):
@@ -24,7 +25,7 @@ class SpartanRequest(BaseRequest):
         path = self.url.path or "/"
         data = unquote_to_bytes(self.url.query)
 
-        encoded_host = self.host.encode("idna")
+        encoded_host = encode_idna(self.host).encode("ascii")
         encoded_path = quote_from_bytes(unquote_to_bytes(path)).encode("ascii")
 
         request = b"%s %s %d\r\n%b" % (encoded_host, encoded_path, len(data), data)
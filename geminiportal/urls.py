@@ -5,6 +5,7 @@ import mimetypes
 import os
 import os.path
 import urllib.parse
+from functools import lru_cache
 from urllib.parse import quote, unquote_to_bytes, urljoin, urlparse, urlunparse
 
 from quart import url_for
@@ -37,6 +38,17 @@ _extend(urllib.parse.uses_relative, PROXY_SCHEMES)
 _extend(urllib.parse.uses_netloc, PROXY_SCHEMES)
 
 
+@lru_cache(maxsize=1024)
+def encode_idna(host: str) -> str:
+    """
+    Convert a domain name to punycode (follows RFC 3490).
+
+    The idna codec is implemented in pure python and the same few hosts are
+    encoded over and over again, e.g. on every line of a gopher menu.
+    """
+    return host.encode("idna").decode("ascii")
+
+
 class URLReference:
     """
     Central class for all URL handling and manipulation.
@@ -276,7 +288,7 @@ class URLReference:
 
         # Convert domain names to punycode for compatibility with URLs that
         # contain encoded IDNs (follows RFC 3490).
-        netloc = self.netloc.encode("idna").decode("ascii")
+        netloc = encode_idna(self.netloc)
         parts = (self.scheme, netloc, path, self.params, self.query, fragment)
         url = urlunparse(parts)
         return f"{url}\r\n".encode()
@@ -399,8 +411,11 @@ class URLReference:
     def copy(self) -> URLReference:
         """
         Return a copy of the current object.
+
+        All of the URL components are immutable strings or ints, so a
+        shallow copy is enough to make the copy independent.
         """
-        return copy.deepcopy(self)
+        return copy.copy(self)
 
     @classmethod
     def from_filename(cls, filename: str):
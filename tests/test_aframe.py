@@ -0,0 +1,13 @@
+from geminiportal.aframe import AFrameEntity, Position, Rotation
+
+
+def test_entity_escapes_attribute_values():
+    entity = AFrameEntity.build_text(
+        position=Position(1, 2, 3),
+        rotation=Rotation(),
+        text='Say "hi" <b>',
+        width=500,
+    )
+    html = str(entity)
+    assert 'value="Say &#34;hi&#34; &lt;b&gt;"' in html
+    assert 'position="1.0000 2.0000 3.0000"' in html
@@ -0,0 +1,30 @@
+from geminiportal.handlers import text
+from geminiportal.handlers.text import TextHandler
+from geminiportal.urls import URLReference
+
+
+def build_text_handler(content: bytes) -> TextHandler:
+    return TextHandler(URLReference("gemini://mozz.us/"), content, "text/plain", "utf-8")
+
+
+async def test_text_handler_link_with_ampersand(app):
+    handler = build_text_handler(b'a & <b> gemini://mozz.us/a?b=1&c=2 "q" </b>\n')
+    async with app.app_context():
+        body = handler.get_body()
+
+    assert body == (
+        "a &amp; &lt;b&gt; "
+        '<a href="http://portal.mozz.us/gemini/mozz.us/a%3Fb%3D1%26c%3D2">'
+        "gemini://mozz.us/a?b=1&amp;c=2</a>"
+        " &#34;q&#34; &lt;/b&gt;"
+    )
+
+
+def test_text_handler_without_links_skips_regex(monkeypatch):
+    class NoMatch:
+        def finditer(self, string):
+            raise AssertionError("url_re should not run on text without links")
+
+    monkeypatch.setattr(text, "url_re", NoMatch())
+    handler = build_text_handler(b"a & <b>mozz.us</b>\r\nline 2\n")
+    assert handler.get_body() == "a &amp; &lt;b&gt;mozz.us&lt;/b&gt;\nline 2"
@@ -72,12 +72,42 @@ def test_build_proxy_request_blocked_host():
         build_proxy_request(url)
 
 
+def test_build_proxy_request_blocked_subdomain():
+    url = URLReference("gemini://www.VGER.cloud./hello")
+    with pytest.raises(ValueError):
+        build_proxy_request(url)
+
+    # URLReference lowercases the hostname, so set a mixed-case host directly
+    request = build_proxy_request(URLReference("gemini://mozz.us/hello"))
+    request.host = "Gemini.WarpEngineer.Space."
+    with pytest.raises(ValueError):
+        request.clean()
+
+
+def test_build_proxy_request_similar_host_allowed():
+    url = URLReference("gemini://notvger.cloud/hello")
+    request = build_proxy_request(url)
+    assert request.host == "notvger.cloud"
+
+
 def test_build_proxy_request_blocked_port():
     url = URLReference("gemini://mozz.us:22")
     with pytest.raises(ValueError):
         build_proxy_request(url)
 
 
+def test_parse_response_header():
+    status, meta = GeminiRequest.parse_response_header(b"20 text/gemini; lang=en\r\n")
+    assert status == "20"
+    assert meta == "text/gemini; lang=en"
+
+
+def test_parse_response_header_status_only():
+    status, meta = GeminiRequest.parse_response_header(b"51\r\n")
+    assert status == "51"
+    assert meta == ""
+
+
 @pytest.mark.integration
 async def test_gemini_request():
     url = URLReference("gemini://mozz.us")
@@ -297,3 +297,11 @@ def test_get_gopher_request_plus_search():
 def test_get_gopher_request_plus_ask():
     url = URLReference("gopher://mozz.us/0selector%09%09?")
     assert url.get_gopher_request() == b"selector\t!\r\n"
+
+
+def test_copy_gopher_plus_string():
+    url = URLReference("gopher://mozz.us/0selector")
+    url_copy = url.copy()
+    url_copy.gopher_plus_string = "+text/plain"
+    assert url_copy.get_url() == "gopher://mozz.us/0selector%09%09+text/plain"
+    assert url.get_url() == "gopher://mozz.us/0selector"